@@ -112,7 +112,7 @@ def ldc(concentration, discharge,
         plot_ylim = ylim
         hb_extent=(1,100, ylim[0], ylim[1])
 
-        if yscale is 'log':
+        if yscale == 'log':
             plot_ylim = (10**ylim[0], 10**ylim[1])
 
 
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from scipy import stats
@@ -25,12 +26,12 @@ def pooled_variance(*pools):
     denominator = 0
 
     for pool in pools:
-        if pool not None:
-            df = pool.count - 1 # degrees of freedom
+        if pool is not None:
+            df = pool.count() - 1 # degrees of freedom
             denominator += df
-            numerator += df * pool.var
+            numerator += df * pool.var()
 
-    pooled_variance = denominator/numerator
+    pooled_variance = numerator/denominator
 
     return pooled_variance
 
@@ -51,6 +52,33 @@ def transform_mdc(mdc):
     return (1-10**(-mdc))*100
 
 
+def ar1_correction(rho, n=None):
+    """
+    Variance inflation factor for the mean of an AR(1) series.
+
+    Broadcasts over rho, so the factors for many sites can be computed in
+    one call.
+
+    Parameters
+    ----------
+    rho : float or array_like
+        Autocorrelation coefficient for autoregressive lag 1, AR(1)
+    n : int, optional
+        Number of observations. If given, include the finite-sample term.
+
+    Returns
+    -------
+    Factor by which autocorrelation inflates the variance of the mean.
+    """
+    rho = np.asarray(rho, dtype=float)
+    c = (1+rho)/(1-rho)
+
+    if n is not None:
+        c = c - (2.0/n) * rho*(1-rho**n)/(1-rho)**2
+
+    return c
+
+
 def mdc_step(pre, post=None, n_post=None, alpha=0.5, sides=1, rho=0):
     """
     Minimum detectable change for a step trend.
@@ -74,7 +102,7 @@ def mdc_step(pre, post=None, n_post=None, alpha=0.5, sides=1, rho=0):
     alpha : float
         Confidence interval
     sides : int
-    rho : float
+    rho : float or array_like
         Autocorrelation coefficient for autoregressive lag 1, AR(1)
 
     Returns
@@ -88,28 +116,28 @@ def mdc_step(pre, post=None, n_post=None, alpha=0.5, sides=1, rho=0):
     1. `Spooner et al., 2011
     <https://www.epa.gov/sites/production/files/2016-05/documents/tech_notes_7_dec_2013_mdc.pdf>`
     """
-    n_pre = pre.count # number of observation in the pre period
+    n_pre = pre.count() # number of observation in the pre period
 
     # set number of observations in the post period
     if post is None:
         n_post = n_post
 
     else:
-        n_post = post.count
+        n_post = post.count()
 
     # calculate degrees of freedom assuming no autocorrelation
     df = n_pre + n_post - 2
 
-    students_t = stats.t.ppf(1-alpha/sides, df)
+    students_t = stats.t.isf(alpha/sides, df)
 
     # estimate the pooled standard deviation
     s_p = sqrt(pooled_variance(pre,post))
 
     # adjust the standard deviation for autocorrelation
-    s_p_correct = s_p * sqrt((1+rho)/(1-rho))
+    s_p_corrected = s_p * np.sqrt(ar1_correction(rho))
 
     MSE = s_p_corrected**2
 
-    mdc = students_t * sqrt( MSE/n_pre + MSE/n_post )
+    mdc = students_t * np.sqrt( MSE/n_pre + MSE/n_post )
 
     return mdc